@@ -1,5 +1,6 @@
 # main.py
 
+from concurrent.futures import ThreadPoolExecutor
 from os import path
 from pathlib import Path
 import time
@@ -29,10 +30,21 @@ def main():
 
     output_report = BASE_DIR / "data/output/internal_linking_report.xlsx"
 
+    # Phase 4 embedding cache (safe to delete; rebuilt on next run)
+    embedding_cache = BASE_DIR / "data/cache/embeddings.parquet"
+
     # ---------------------------------------------------------------
     # PHASE 2 – LOAD INPUTS
     # ---------------------------------------------------------------
-    blog_df = load_blog_content(blog_content_file)
+    # Independent I/O-bound reads: load all three inputs concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        blog_future = executor.submit(load_blog_content, blog_content_file)
+        meta_future = executor.submit(load_page_metadata, page_metadata_file)
+        links_future = executor.submit(load_internal_links, internal_links_file)
+
+        blog_df = blog_future.result()
+        meta_df = meta_future.result()
+        raw_links_list = links_future.result()
 
     blog_df = blog_df[
     blog_df["url"].apply(is_real_blog_article_url)
@@ -63,9 +75,6 @@ def main():
     blog_df["_source_type"] = blog_df["url"].apply(classify_source_url)
     print(blog_df["_source_type"].value_counts(dropna=False))
 
-    meta_df = load_page_metadata(page_metadata_file)
-    raw_links_list = load_internal_links(internal_links_file)
-
     # ---------------------------------------------------------------
     # REQUIRED BY PHASE 4 – FALLBACK ANCHOR TEXT
     # ---------------------------------------------------------------
@@ -84,8 +93,9 @@ def main():
     meta_df["priority_tier"] = meta_df["importance"]
     meta_df["priority_score"] = 0  # Phase 1 intentionally skipped
 
-    # For orphan detection (metadata = universe of pages)
-    crawled_urls = set(meta_df["url"])
+    # For orphan detection (metadata = universe of pages);
+    # passed as an array so .isin hashes it once in C
+    crawled_urls = meta_df["url"].values
 
     # ---------------------------------------------------------------
     # PHASE 3 – AUDIT CURRENT STATE
@@ -103,6 +113,7 @@ def main():
         blog_df=blog_df,
         meta_df=audited_df,          # audited_df still contains metadata
         raw_links_list=raw_links_list,
+        embedding_cache_path=embedding_cache,
     )
 
     # ---------------------------------------------------------------
@@ -4,6 +4,8 @@ from pathlib import Path
 import pandas as pd
 from typing import Union
 
+from phases.phase_2_csv_reader import TEXT_DTYPE, read_csv_fast
+
 
 
 REQUIRED_COLUMNS = {
@@ -11,6 +13,16 @@ REQUIRED_COLUMNS = {
     "content",
 }
 
+TRAFFIC_COLUMNS = ("non_branded_traffic", "traffic", "sessions")
+
+# Columns parsed from CSV (everything else is skipped); traffic is coerced below
+BLOG_DTYPES = {
+    "url": TEXT_DTYPE,
+    "content": TEXT_DTYPE,
+    "language": TEXT_DTYPE,
+    **{col: TEXT_DTYPE for col in TRAFFIC_COLUMNS},
+}
+
 
 def load_blog_content(
     path: Union[str, Path],
@@ -34,7 +46,7 @@ def load_blog_content(
         raise FileNotFoundError(f"Blog content file not found: {path}")
 
     if path.suffix.lower() == ".csv":
-        df = pd.read_csv(path, encoding=encoding)
+        df = read_csv_fast(path, encoding=encoding, dtypes=BLOG_DTYPES)
     elif path.suffix.lower() in {".xlsx", ".xls"}:
         df = pd.read_excel(path)
     else:
@@ -48,15 +60,16 @@ def load_blog_content(
         raise ValueError(f"Missing required columns: {missing}")
 
     # Clean core fields
-    df["url"] = df["url"].astype(str).str.strip()
-    df["content"] = df["content"].fillna("").astype(str)
+    df["url"] = df["url"].astype(TEXT_DTYPE).fillna("").str.strip()
+    df["content"] = df["content"].astype(TEXT_DTYPE).fillna("")
 
     # Optional numeric cleanup
-    if "non_branded_traffic" in df.columns:
-        df["non_branded_traffic"] = (
-            pd.to_numeric(df["non_branded_traffic"], errors="coerce")
-            .fillna(0)
-            .astype(int)
-        )
+    for col in TRAFFIC_COLUMNS:
+        if col in df.columns:
+            df[col] = (
+                pd.to_numeric(df[col], errors="coerce")
+                .fillna(0)
+                .astype(int)
+            )
 
     return df
@@ -0,0 +1,55 @@
+# phases/phase_2_csv_reader.py
+
+from pathlib import Path
+import pandas as pd
+from typing import Dict, Optional, Union
+
+try:
+    import polars as pl
+except ImportError:  # optional, faster multithreaded parser
+    pl = None
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:  # optional, enables pandas' pyarrow engine
+    HAS_PYARROW = False
+
+
+UTF8_ENCODINGS = {"utf-8", "utf8"}
+
+# Arrow-backed strings: no per-value Python objects, Arrow kernels for .str ops
+TEXT_DTYPE = "string[pyarrow]" if HAS_PYARROW else "string"
+
+
+def read_csv_fast(
+    path: Union[str, Path],
+    encoding: str = "utf-8",
+    dtypes: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    Reads a CSV with the fastest parser available:
+    - polars (UTF-8 files only; columns read as strings, loaders coerce types)
+    - pandas with the pyarrow engine
+    - pandas default C engine
+
+    dtypes maps normalized (stripped, lower-case) column names to dtypes.
+    When given, only those columns are parsed, with the declared types.
+    """
+
+    usecols = dtype = None
+    if dtypes:
+        header = pd.read_csv(path, encoding=encoding, nrows=0).columns
+        raw_names = {str(c).strip().lower(): c for c in header}
+        dtype = {raw_names[name]: t for name, t in dtypes.items() if name in raw_names}
+        usecols = list(dtype) or None
+
+    if pl is not None and HAS_PYARROW and encoding.lower() in UTF8_ENCODINGS:
+        return pl.read_csv(path, columns=usecols, infer_schema_length=0).to_pandas()
+
+    if HAS_PYARROW:
+        return pd.read_csv(
+            path, encoding=encoding, engine="pyarrow", usecols=usecols, dtype=dtype
+        )
+
+    return pd.read_csv(path, encoding=encoding, usecols=usecols, dtype=dtype)
@@ -4,6 +4,8 @@ from pathlib import Path
 import pandas as pd
 from typing import Union
 
+from phases.phase_2_csv_reader import TEXT_DTYPE, read_csv_fast
+
 
 
 REQUIRED_COLUMNS = {
@@ -12,6 +14,13 @@ REQUIRED_COLUMNS = {
     "anchor",
 }
 
+# Columns parsed from CSV (everything else is skipped)
+LINK_DTYPES = {
+    "source_url": TEXT_DTYPE,
+    "target_url": TEXT_DTYPE,
+    "anchor": TEXT_DTYPE,
+}
+
 
 def load_internal_links(
     path: Union[str, Path],
@@ -35,7 +44,7 @@ def load_internal_links(
         raise FileNotFoundError(f"Internal links file not found: {path}")
 
     if path.suffix.lower() == ".csv":
-        df = pd.read_csv(path, encoding=encoding)
+        df = read_csv_fast(path, encoding=encoding, dtypes=LINK_DTYPES)
     elif path.suffix.lower() in {".xlsx", ".xls"}:
         df = pd.read_excel(path)
     else:
@@ -49,18 +58,15 @@ def load_internal_links(
         raise ValueError(f"Missing required columns: {missing}")
 
     # Clean fields
-    df["source_url"] = df["source_url"].astype(str).str.strip()
-    df["target_url"] = df["target_url"].astype(str).str.strip()
-    df["anchor"] = df["anchor"].fillna("").astype(str).str.strip()
-
-    # Convert to expected structure
-    raw_links_list = [
-        {
-            "source": row["source_url"],
-            "dest": row["target_url"],
-            "anchor": row["anchor"],
-        }
-        for _, row in df.iterrows()
-    ]
+    df["source_url"] = df["source_url"].astype(TEXT_DTYPE).fillna("").str.strip()
+    df["target_url"] = df["target_url"].astype(TEXT_DTYPE).fillna("").str.strip()
+    df["anchor"] = df["anchor"].astype(TEXT_DTYPE).fillna("").str.strip()
+
+    # Convert to expected structure (columnar, no per-row Series)
+    raw_links_list = (
+        df[["source_url", "target_url", "anchor"]]
+        .rename(columns={"source_url": "source", "target_url": "dest"})
+        .to_dict("records")
+    )
 
     return raw_links_list
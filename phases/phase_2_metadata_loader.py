@@ -4,6 +4,8 @@ from pathlib import Path
 import pandas as pd
 from typing import Union
 
+from phases.phase_2_csv_reader import TEXT_DTYPE, read_csv_fast
+
 
 REQUIRED_COLUMNS = {
     "url",
@@ -14,6 +16,19 @@ REQUIRED_COLUMNS = {
 
 VALID_IMPORTANCE = {"A", "B", "C"}
 
+NUMERIC_COLUMNS = ("search_volume", "current_traffic")
+
+# Columns parsed from CSV (everything else is skipped); numerics are coerced below
+META_DTYPES = {
+    "url": TEXT_DTYPE,
+    "title": TEXT_DTYPE,
+    "h1": TEXT_DTYPE,
+    "meta_description": TEXT_DTYPE,
+    "importance": TEXT_DTYPE,
+    "best_anchor_text": TEXT_DTYPE,
+    **{col: TEXT_DTYPE for col in NUMERIC_COLUMNS},
+}
+
 
 def load_page_metadata(
     path: Union[str, Path],
@@ -40,7 +55,7 @@ def load_page_metadata(
         raise FileNotFoundError(f"Page metadata file not found: {path}")
 
     if path.suffix.lower() == ".csv":
-        df = pd.read_csv(path, encoding=encoding)
+        df = read_csv_fast(path, encoding=encoding, dtypes=META_DTYPES)
     elif path.suffix.lower() in {".xlsx", ".xls"}:
         df = pd.read_excel(path)
     else:
@@ -58,16 +73,16 @@ def load_page_metadata(
         df["h1"] = ""
 
     # Clean URL
-    df["url"] = df["url"].astype(str).str.strip()
+    df["url"] = df["url"].astype(TEXT_DTYPE).fillna("").str.strip()
 
     # Clean text fields
     for col in ["title", "h1", "meta_description"]:
-        df[col] = df[col].fillna("").astype(str).str.strip()
+        df[col] = df[col].astype(TEXT_DTYPE).fillna("").str.strip()
 
     # Normalize importance
     df["importance"] = (
         df["importance"]
-        .astype(str)
+        .astype(TEXT_DTYPE)
         .str.strip()
         .str.upper()
     )
@@ -80,7 +95,7 @@ def load_page_metadata(
         )
 
     # Optional numeric fields (safe to include)
-    for col in ["search_volume", "current_traffic"]:
+    for col in NUMERIC_COLUMNS:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
 
@@ -1,6 +1,7 @@
 # phases/phase_3_audit.py
 
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List
+import numpy as np
 import pandas as pd
 
 
@@ -17,19 +18,13 @@ GENERIC_ANCHORS = {
 }
 
 
-def is_generic_anchor(anchor: str) -> bool:
-    if not isinstance(anchor, str):
-        return False
-    return anchor.strip().lower() in GENERIC_ANCHORS
-
-
 # -------------------------------------------------------------------
 # Phase 3: Audit
 # -------------------------------------------------------------------
 
 def audit_internal_links(
     page_df: pd.DataFrame,
-    crawled_urls: Set[str],
+    crawled_urls: Iterable[str],
     raw_links_list: List[Dict],
     url_column: str = "url",
     priority_column: str = "priority_tier",
@@ -37,6 +32,9 @@ def audit_internal_links(
 ) -> pd.DataFrame:
     """
     Enriches page_df with internal linking audit metrics.
+
+    crawled_urls may be any list-like accepted by Series.isin
+    (set, array, Series).
     """
 
     data = page_df.copy()
@@ -88,20 +86,21 @@ def audit_internal_links(
         .to_dict()
     )
 
-    def equity_for_url(url: str) -> float:
-        incoming = links_df[links_df["dest"] == url]
-        return sum(
-            source_scores.get(src, 0)
-            for src in incoming["source"]
-        )
+    equity_by_dest = (
+        links_df["source"].map(source_scores).fillna(0)
+        .groupby(links_df["dest"])
+        .sum()
+    )
 
-    data["link_equity_score"] = data[url_column].apply(equity_for_url)
+    data["link_equity_score"] = data[url_column].map(equity_by_dest).fillna(0.0)
 
     # ---------------------------------------------------------------
     # Generic anchor check (important pages only)
     # ---------------------------------------------------------------
+    anchor_lc = links_df["anchor"].astype("string").str.strip().str.lower()
+
     generic_anchor_targets = (
-        links_df[links_df["anchor"].apply(is_generic_anchor)]
+        links_df[anchor_lc.isin(GENERIC_ANCHORS)]
         .groupby("dest")
         .size()
         .index
@@ -112,15 +111,20 @@ def audit_internal_links(
     # ---------------------------------------------------------------
     # Gap status assignment
     # ---------------------------------------------------------------
-    def gap_status(row):
-        if row["is_orphan"]:
-            return "CRITICAL: Orphan Page"
-        if row[priority_column] in ("A", "B") and row["receiving_links"] == 0:
-            return "High: Under-Linked"
-        if row[priority_column] in ("A", "B") and row["has_generic_anchors"]:
-            return "Medium: Poor Anchors"
-        return "Healthy"
-
-    data["gap_status"] = data.apply(gap_status, axis=1)
+    is_important = data[priority_column].isin(["A", "B"])
+
+    data["gap_status"] = np.select(
+        [
+            data["is_orphan"],
+            is_important & (data["receiving_links"] == 0),
+            is_important & data["has_generic_anchors"],
+        ],
+        [
+            "CRITICAL: Orphan Page",
+            "High: Under-Linked",
+            "Medium: Poor Anchors",
+        ],
+        default="Healthy",
+    )
 
     return data
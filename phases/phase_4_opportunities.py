@@ -1,19 +1,36 @@
+import hashlib
+import os
 import re
+from pathlib import Path
 from urllib.parse import urlparse
-from typing import Set, Tuple, Optional, List, Dict, Any
+from typing import FrozenSet, Iterable, Set, Tuple, Optional, List, Dict, Any, Union
 
+import numpy as np
 import pandas as pd
+import torch
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, enables the on-disk embedding cache
+    pa = pq = None
 
 
 # --------------------------------------------------
 # Config
 # --------------------------------------------------
 
+MODEL_NAME = "all-MiniLM-L6-v2"
 MIN_SENTENCE_WORDS = 6
 PAGE_SIMILARITY_FLOOR = 0.50
 SENTENCE_SIMILARITY_FLOOR = 0.64
+ENCODE_BATCH_SIZE = 128
+
+_TOKEN_RE = re.compile(r"[a-z0-9]{4,}")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# optional scheme + host, then the first path segment
+_FIRST_PATH_SEGMENT_RE = re.compile(r"^(?:[a-z][a-z0-9+.\-]*:)?(?://[^/?#]*)?/*([^/?#]*)")
 
 
 # --------------------------------------------------
@@ -24,12 +41,113 @@ _MODEL: Optional[SentenceTransformer] = None
 
 
 def get_model() -> SentenceTransformer:
+    """
+    Loads the encoder once. Uses the GPU in FP16 when CUDA is available,
+    otherwise lets sentence-transformers pick the device (e.g. MPS) in FP32.
+    """
     global _MODEL
     if _MODEL is None:
-        _MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+        if torch.cuda.is_available():
+            _MODEL = SentenceTransformer(MODEL_NAME, device="cuda").half()
+        else:
+            _MODEL = SentenceTransformer(MODEL_NAME)
     return _MODEL
 
 
+def encode_texts(
+    texts: List[str],
+    cache: Optional[Dict[str, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Encodes all texts in one batched call.
+    Returns an (N, dim) float32 matrix of unit-length rows,
+    so cosine similarity reduces to a dot product.
+
+    With a cache (text hash -> vector), only texts missing from it are
+    encoded; new vectors are added to the cache in place.
+    """
+    model = get_model()
+
+    if cache is not None and texts:
+        hashes = [text_hash(t) for t in texts]
+        missing = {h: t for h, t in zip(hashes, texts) if h not in cache}
+        if missing:
+            cache.update(zip(missing, encode_texts(list(missing.values()))))
+        return np.vstack([cache[h] for h in hashes])
+
+    if not texts:
+        return np.zeros((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+    vectors = model.encode(
+        texts,
+        batch_size=ENCODE_BATCH_SIZE,
+        show_progress_bar=False,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+    # FP16 models return half-precision rows; similarity math runs in FP32
+    return vectors.astype(np.float32, copy=False)
+
+
+# --------------------------------------------------
+# Embedding cache (on disk, keyed by content hash)
+# --------------------------------------------------
+
+def text_hash(text: str) -> str:
+    # model name is part of the key so a model change never reuses vectors
+    # (the cache file itself is per model too, see embedding_cache_file)
+    return hashlib.blake2b(
+        f"{MODEL_NAME}\0{text}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+def embedding_cache_file(path: Union[str, Path]) -> Path:
+    """
+    Per-model cache file next to the configured path, e.g.
+    embeddings.parquet -> embeddings_all-MiniLM-L6-v2.parquet.
+    Vectors of different models (and widths) never share a file.
+    """
+    path = Path(path)
+    model_slug = re.sub(r"[^A-Za-z0-9.\-]+", "-", MODEL_NAME)
+    return path.with_name(f"{path.stem}_{model_slug}{path.suffix}")
+
+
+def load_embedding_cache(path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    path = embedding_cache_file(path)
+    if pq is None or not path.exists():
+        return {}
+
+    table = pq.read_table(path)
+    matrix = (
+        table.column("vector").combine_chunks().flatten()
+        .to_numpy(zero_copy_only=False)
+        .astype(np.float32, copy=False)
+        .reshape(table.num_rows, -1)
+    )
+    return dict(zip(table.column("hash").to_pylist(), matrix))
+
+
+def save_embedding_cache(path: Union[str, Path], cache: Dict[str, np.ndarray]) -> None:
+    if pq is None or not cache:
+        return
+
+    path = embedding_cache_file(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    hashes = list(cache)
+    matrix = np.vstack([cache[h] for h in hashes]).astype(np.float32, copy=False)
+    table = pa.table({
+        "hash": hashes,
+        "vector": pa.FixedSizeListArray.from_arrays(pa.array(matrix.ravel()), matrix.shape[1]),
+    })
+
+    # write next to the target, then swap in atomically
+    tmp_path = path.with_name(path.name + ".tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
 # --------------------------------------------------
 # Helpers
 # --------------------------------------------------
@@ -50,35 +168,27 @@ def normalize_url(u: Any) -> str:
 def split_into_sentences(text: Any) -> List[str]:
     if not isinstance(text, str) or pd.isna(text):
         return []
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-    return [s.strip() for s in sentences if len(s.split()) >= MIN_SENTENCE_WORDS]
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    # maxsplit stops word splitting once the minimum is reached
+    return [
+        s.strip() for s in sentences
+        if len(s.split(None, MIN_SENTENCE_WORDS - 1)) >= MIN_SENTENCE_WORDS
+    ]
 
 
-def detect_language_from_url(url: str) -> str:
+def detect_language_series(urls: pd.Series) -> pd.Series:
     """
-    3-bucket language detection:
+    3-bucket language detection for a whole column of URLs:
       - 'de'   for /de/... or .../de
       - 'en'   for /en/... or .../en
       - 'none' for URLs without a language subfolder
     """
-    try:
-        path = urlparse(url).path.lower()
-    except Exception:
-        path = (url or "").lower()
-
-    p = path.strip("/")
-
-    if not p:
-        return "none"
-
-    first = p.split("/", 1)[0]
-
-    if first == "de" or p == "de":
-        return "de"
-    if first == "en" or p == "en":
-        return "en"
-
-    return "none"
+    first = (
+        urls.astype("string")
+        .str.lower()
+        .str.extract(_FIRST_PATH_SEGMENT_RE, expand=False)
+    )
+    return first.where(first.isin(["de", "en"]), "none").astype(object)
 
 
 def is_homepage(url: str) -> bool:
@@ -112,48 +222,62 @@ def is_real_blog_article_url(url: str) -> bool:
     return True
 
 
-def get_best_anchor(target_row: pd.Series) -> Optional[str]:
-    anchor = str(target_row.get("best_anchor_text", "")).strip()
-    if not anchor or anchor.upper() == "N/A":
-        return None
-    return anchor
+def build_best_anchors(audited_df: pd.DataFrame) -> pd.Series:
+    """
+    Stripped best_anchor_text for every row at once; None when missing, blank or "N/A".
+    """
+    if "best_anchor_text" not in audited_df.columns:
+        return pd.Series(None, index=audited_df.index, dtype=object)
+
+    anchor = audited_df["best_anchor_text"].astype("string").str.strip()
+    valid = anchor.notna() & anchor.ne("") & anchor.str.upper().ne("N/A")
+    return anchor.astype(object).where(valid.to_numpy(dtype=bool, na_value=False), None)
 
 
-def build_topic_tokens(target_row: pd.Series) -> List[str]:
-    text = " ".join([
-        str(target_row.get("title", "")),
-        str(target_row.get("h1", "")),
-        str(target_row.get("meta_description", "")),
-        str(target_row.get("best_anchor_text", "")),
-    ]).lower()
+def build_topic_tokens(audited_df: pd.DataFrame) -> pd.Series:
+    """
+    Topic tokens for every row at once (title, h1, meta description, best anchor).
+    Returns a Series of frozensets aligned with audited_df.
+    """
+    text = pd.Series("", index=audited_df.index, dtype=object)
+    for col in ("title", "h1", "meta_description", "best_anchor_text"):
+        if col in audited_df.columns:
+            text = text + " " + audited_df[col].fillna("").astype(str)
 
-    return list(set(re.findall(r"[a-z0-9]{4,}", text)))
+    return text.str.lower().str.findall(_TOKEN_RE).map(frozenset)
 
 
 # --------------------------------------------------
 # Target embeddings (Tier A only)
 # --------------------------------------------------
 
-def build_target_embeddings(audited_df: pd.DataFrame) -> Dict[str, Any]:
+def build_target_embeddings(
+    audited_df: pd.DataFrame,
+    cache: Optional[Dict[str, np.ndarray]] = None,
+) -> Dict[str, np.ndarray]:
     url_col = first_existing_column(audited_df, ("url", "target_url", "page_url"))
     tier_col = first_existing_column(audited_df, ("priority_tier", "tier"))
 
-    model = get_model()
-    vectors: Dict[str, Any] = {}
+    targets = audited_df[audited_df[tier_col].astype(str).str.strip().str.upper() == "A"]
+    if targets.empty:
+        return {}
 
-    for _, row in audited_df.iterrows():
-        if str(row[tier_col]).strip().upper() != "A":
-            continue
+    # missing -> "" so a page with no metadata falls back to its URL
+    def text(col: str) -> pd.Series:
+        if col in targets.columns:
+            return targets[col].fillna("").astype(str)
+        return pd.Series("", index=targets.index, dtype=object)
 
-        intent_text = " ".join([
-            str(row.get("title", "")),
-            str(row.get("h1", "")),
-            str(row.get("meta_description", "")),
-        ]).strip() or str(row[url_col])
+    intent_text = (text("title") + " " + text("h1") + " " + text("meta_description")).str.strip()
+    intent_text = intent_text.where(intent_text != "", text(url_col))
 
-        vectors[normalize_url(row[url_col])] = model.encode(intent_text)
+    # Pages sharing the same intent text are encoded once
+    # (no NA sentinel: every row gets a real code, never -1)
+    codes, unique_texts = pd.factorize(intent_text, use_na_sentinel=False)
+    unique_vectors = encode_texts(list(unique_texts), cache)
 
-    return vectors
+    # unit length, so similarity against it is a plain dot product
+    return dict(zip(targets[url_col].map(normalize_url), unique_vectors[codes]))
 
 
 # --------------------------------------------------
@@ -163,7 +287,8 @@ def build_target_embeddings(audited_df: pd.DataFrame) -> Dict[str, Any]:
 def find_internal_link_opportunities(
     blog_df: pd.DataFrame,
     audited_df: pd.DataFrame,
-    existing_links: Set[Tuple[str, str]],
+    existing_links: Iterable[Tuple[str, str]],
+    embedding_cache_path: Optional[Union[str, Path]] = None,
 ) -> pd.DataFrame:
 
     blog_url_col = first_existing_column(blog_df, ("url", "source_url"))
@@ -174,119 +299,150 @@ def find_internal_link_opportunities(
     )
     target_url_col = first_existing_column(audited_df, ("url", "target_url"))
 
-    model = get_model()
-    opportunities: List[Dict[str, Any]] = []
-
-    page_embedding_cache: Dict[str, Any] = {}
-    sentence_embedding_cache: Dict[str, Any] = {}
-
-    target_vectors = build_target_embeddings(audited_df)
-
-    # Build a fast lookup for target rows (normalized)
-    audited_lookup = {
-        normalize_url(row[target_url_col]): row
-        for _, row in audited_df.iterrows()
-        if isinstance(row.get(target_url_col), str) or not pd.isna(row.get(target_url_col))
-    }
-
-    for target_url, target_vector in target_vectors.items():
-
-        target_row = audited_lookup.get(target_url)
-        if target_row is None:
+    cache = load_embedding_cache(embedding_cache_path) if embedding_cache_path else None
+    cached_count = len(cache) if cache is not None else 0
+
+    target_vectors = build_target_embeddings(audited_df, cache)
+
+    # Per-target lookups keyed by normalized URL (last duplicate wins)
+    target_keys = audited_df[target_url_col].astype("string").str.strip().str.rstrip("/")
+    has_url = audited_df[target_url_col].notna()
+
+    best_anchor_by_url = dict(zip(
+        target_keys[has_url],
+        build_best_anchors(audited_df)[has_url],
+    ))
+    topic_tokens_by_url = dict(zip(
+        target_keys.fillna(""),
+        build_topic_tokens(audited_df),
+    ))
+
+    # --- SOURCES: target-independent checks, done once ---
+    source_positions: Dict[str, int] = {}
+    source_urls: List[str] = []
+    source_contents: List[str] = []
+    source_traffic: List[int] = []
+    sentence_starts: List[int] = []         # first entry of each source in sentence_ids
+    sentence_ids: List[int] = []            # per-source sentence occurrences
+    sentence_index: Dict[str, int] = {}     # sentence -> row in unique_sentences
+    unique_sentences: List[str] = []
+    sentence_tokens: List[FrozenSet[str]] = []   # topic-token candidates per unique sentence
+
+    for _, blog in blog_df.iterrows():
+        source_url = normalize_url(blog[blog_url_col])
+
+        if not source_url:
             continue
-
-        # --- HARD RULES ---
-        best_anchor = get_best_anchor(target_row)
-        if not best_anchor:
+        if source_url in source_positions:   # duplicate URL: first usable row wins
             continue
-
-        if is_homepage(target_url):
+        if not is_real_blog_article_url(source_url):
             continue
 
-        target_lang = detect_language_from_url(target_url)
-        topic_tokens = build_topic_tokens(target_row)
-
-        for _, blog in blog_df.iterrows():
-            source_url = normalize_url(blog[blog_url_col])
-
-            if not source_url:
-                continue
-            if not is_real_blog_article_url(source_url):
-                continue
-
-            # avoid self + duplicates
-            if source_url == target_url or (source_url, target_url) in existing_links:
-                continue
-
-            source_lang = detect_language_from_url(source_url)
-
-            # Strict rule: only link within same language bucket
-            # - de ↔ de
-            # - en ↔ en
-            # - none ↔ none
-            if source_lang != target_lang:
-                if not (source_lang == "none" and target_lang == "en"):
-                    continue
-
-            content = str(blog[blog_content_col])
-            if not content or content.lower() == "nan":
-                continue
-
-            source_traffic = (
-                int(blog[traffic_col])
-                if traffic_col and not pd.isna(blog[traffic_col])
-                else 0
-            )
-
-            sentences = split_into_sentences(content)
-            if not sentences:
-                continue
-
-            if source_url not in page_embedding_cache:
-                page_embedding_cache[source_url] = model.encode(content)
-
-            page_sim = cosine_similarity(
-                [page_embedding_cache[source_url]],
-                [target_vector],
-            )[0][0]
-
-            if page_sim < PAGE_SIMILARITY_FLOOR:
-                continue
-
-            best_score = 0.0
-
-            for sentence in sentences:
-                if sentence not in sentence_embedding_cache:
-                    sentence_embedding_cache[sentence] = model.encode(sentence)
-
-                sim = cosine_similarity(
-                    [sentence_embedding_cache[sentence]],
-                    [target_vector],
-                )[0][0]
-
-                if sim >= SENTENCE_SIMILARITY_FLOOR:
-                    sentence_lc = sentence.lower()
-                    sentence_tokens = set(re.findall(r"[a-z0-9]{4,}", sentence_lc))
-                    token_overlap = len(sentence_tokens.intersection(set(topic_tokens)))
-                    if token_overlap < 2:
-                        continue
-                    best_score = max(best_score, sim)
+        content = str(blog[blog_content_col])
+        if not content or content.lower() == "nan":
+            continue
 
-            if best_score == 0.0:
-                continue
+        sentences = split_into_sentences(content)
+        if not sentences:
+            continue
 
-            opportunities.append({
-                "source_url": source_url,
-                "target_url": target_url,
-                "suggested_anchor": best_anchor,
-                "source_non_branded_traffic": source_traffic,
-                "confidence": round(best_score, 3),
-            })
+        source_positions[source_url] = len(source_urls)
+        source_urls.append(source_url)
+        source_contents.append(content)
+        source_traffic.append(
+            int(blog[traffic_col])
+            if traffic_col and not pd.isna(blog[traffic_col])
+            else 0
+        )
+        sentence_starts.append(len(sentence_ids))
+        for sentence in sentences:
+            if sentence not in sentence_index:
+                sentence_index[sentence] = len(unique_sentences)
+                unique_sentences.append(sentence)
+                sentence_tokens.append(frozenset(_TOKEN_RE.findall(sentence.lower())))
+            sentence_ids.append(sentence_index[sentence])
+
+    if not source_urls or not target_vectors:
+        return pd.DataFrame()
+
+    # --- EMBEDDINGS: one batched encode per text kind, one matmul per similarity ---
+    target_urls = list(target_vectors)
+    target_matrix = np.vstack([target_vectors[u] for u in target_urls])
+
+    page_sims = encode_texts(source_contents, cache) @ target_matrix.T   # (sources, targets)
+    sent_sims = encode_texts(unique_sentences, cache) @ target_matrix.T  # (unique sentences, targets)
+
+    if cache is not None and len(cache) > cached_count:
+        save_embedding_cache(embedding_cache_path, cache)
+
+    # --- TARGET HARD RULES ---
+    target_anchors = [best_anchor_by_url.get(u) for u in target_urls]
+    target_ok = np.array([
+        bool(anchor) and not is_homepage(url)
+        for url, anchor in zip(target_urls, target_anchors)
+    ], dtype=bool)
+
+    source_arr = np.array(source_urls, dtype=object)
+    target_arr = np.array(target_urls, dtype=object)
+    source_lang_arr = detect_language_series(pd.Series(source_urls, dtype=object)).to_numpy()
+    target_lang_arr = detect_language_series(pd.Series(target_urls, dtype=object)).to_numpy()
+
+    # --- PAIR MASK (sources x targets) ---
+    # Strict rule: only link within same language bucket
+    # - de ↔ de
+    # - en ↔ en
+    # - none ↔ none (none sources may also link to en targets)
+    same_lang = (source_lang_arr[:, None] == target_lang_arr[None, :]) | (
+        (source_lang_arr == "none")[:, None] & (target_lang_arr == "en")[None, :]
+    )
 
-    out = pd.DataFrame(opportunities)
+    pair_ok = (
+        (page_sims >= PAGE_SIMILARITY_FLOOR)
+        & same_lang
+        & target_ok[None, :]
+        & (source_arr[:, None] != target_arr[None, :])   # avoid self
+    )
 
-    if out.empty:
-        return out
+    # avoid duplicates
+    target_positions = {u: t for t, u in enumerate(target_urls)}
+
+    for source_url, target_url in existing_links:
+        s = source_positions.get(source_url)
+        t = target_positions.get(target_url)
+        if s is not None and t is not None:
+            pair_ok[s, t] = False
+
+    # --- SENTENCE SCORES (unique sentences x targets) ---
+    # A sentence qualifies when it is similar enough AND shares >= 2 topic tokens
+    # with the target; only the (sparse) similar pairs need the token check.
+    target_topic_tokens = [topic_tokens_by_url[u] for u in target_urls]
+    sent_scores = np.where(sent_sims >= SENTENCE_SIMILARITY_FLOOR, sent_sims, 0.0)
+
+    for i, t in zip(*np.nonzero(sent_scores)):
+        if len(sentence_tokens[i] & target_topic_tokens[t]) < 2:
+            sent_scores[i, t] = 0.0
+
+    # Best qualifying sentence per (source, target): max over each source's
+    # sentences, one source at a time (no occurrences x targets copy)
+    sentence_id_arr = np.asarray(sentence_ids, dtype=np.intp)
+    sentence_ends = sentence_starts[1:] + [len(sentence_ids)]
+    best_scores = np.empty((len(source_urls), len(target_urls)), dtype=sent_scores.dtype)
+    for s, (start, end) in enumerate(zip(sentence_starts, sentence_ends)):
+        best_scores[s] = sent_scores[sentence_id_arr[start:end]].max(axis=0)
+
+    # Target-major order, matching the previous per-target assembly
+    t_idx, s_idx = np.nonzero((pair_ok & (best_scores > 0.0)).T)
+
+    if len(s_idx) == 0:
+        return pd.DataFrame()
+
+    out = pd.DataFrame({
+        "source_url": source_arr[s_idx],
+        "target_url": target_arr[t_idx],
+        "suggested_anchor": np.array(target_anchors, dtype=object)[t_idx],
+        "source_non_branded_traffic": np.array(source_traffic)[s_idx],
+        "confidence": best_scores[s_idx, t_idx].astype(np.float64).round(3),
+    })
 
     out = out.sort_values(
     by=["source_url", "confidence", "source_non_branded_traffic"],
@@ -304,6 +460,7 @@ def run_phase_4_opportunities(*args, **kwargs) -> pd.DataFrame:
     blog_df = kwargs.get("blog_df")
     audited_df = kwargs.get("audited_df") or kwargs.get("meta_df")
     raw_links_list = kwargs.get("raw_links_list")
+    embedding_cache_path = kwargs.get("embedding_cache_path")
 
     if blog_df is None and len(args) > 0:
         blog_df = args[0]
@@ -328,4 +485,5 @@ def run_phase_4_opportunities(*args, **kwargs) -> pd.DataFrame:
         blog_df=blog_df,
         audited_df=audited_df,
         existing_links=existing_links,
+        embedding_cache_path=embedding_cache_path,
     )
@@ -4,8 +4,35 @@ from typing import List, Dict, Union, Optional, Any
 from pathlib import Path
 import re
 from urllib.parse import urlparse
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+except ImportError:  # optional, columnar link input
+    pa = None
+
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_ENGINE = "xlsxwriter"
+except ImportError:  # optional, faster write-only engine
+    EXCEL_ENGINE = "openpyxl"   # used in write_only (streaming) mode
+
+# xlsxwriter turns URL-like strings into hyperlinks by default, but only
+# 65,530 fit on a sheet and URLs over 2,079 chars are refused; past that
+# cells are silently dropped. Reports hold plain strings (like openpyxl).
+XLSXWRITER_OPTIONS = {"strings_to_urls": False}
+
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_COLS = 16_384
+
+# output_path ending in .parquet skips Excel and writes one file per sheet
+PARQUET_SHEET_NAMES = {
+    "Page_Summary_Report": "page_summary",
+    "Actionable_Opportunities": "actionable",
+    "Anchor_Text_Optimization": "anchor_opt",
+}
+
 
 # -------------------------------------------------------------------
 # GLOBAL CONFIG (Phase 5)
@@ -146,62 +173,55 @@ COMMERCIAL_ANCHOR_RULES = [
 ]
 
 
-_DATE_ONLY_PATTERNS = [
-    r"^\d{1,2}[./-]\d{1,2}[./-]\d{2,4}$",
-    r"^\d{4}-\d{2}-\d{2}$",
-    r"^\d{4}$",
+# Compiled once at import. The union only answers "does ANY rule match";
+# rule priority still comes from checking the compiled rules in order.
+# Patterns are lower-case and only ever run (with Python re, see
+# _re_mask) on lower-cased anchors, so they need no re.IGNORECASE.
+_COMPILED_RULE_PATTERNS = [
+    re.compile(rule["pattern"]) for rule in COMMERCIAL_ANCHOR_RULES
 ]
+_ANY_RULE_RE = re.compile(
+    "|".join(f"(?:{rule['pattern']})" for rule in COMMERCIAL_ANCHOR_RULES)
+)
+
+
+# 01.01.2019 / 01/01/19 | 2019-01-01 | 2019
+_DATE_ONLY_RE = re.compile(
+    r"^(?:\d{1,2}[./-]\d{1,2}[./-]\d{2,4}|\d{4}-\d{2}-\d{2}|\d{4})$"
+)
+_LISTICLE_RE = re.compile(
+    r"^\s*\d{1,3}\s+(?:best|beste|top|tipps|tips|gründe|reasons|maßnahmen|measures|steps|schritte)\b"
+)
+_HEADLINE_WORD_RE = re.compile(
+    r"\b(?:vergleich|test|guide|anleitung|tutorial|checkliste|trends|liste|ranking)\b"
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LEADING_PREPOSITION_RE = re.compile(r"^(zum|zur|zu|to|for|über|about)\s+")
+_WORD_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Plain http(s) URLs only. Anything urlparse would treat specially
+# (";params", whitespace/control chars, IPv6 hosts, upper-case or
+# other schemes) does not match and falls back to urlparse.
+_URL_RE = re.compile(
+    r"^(?P<scheme>https?)://(?P<host>[^/?#;\[\]\x00-\x20\x7f-\U0010ffff]+)"
+    r"(?P<path>(?:/[^?#;\x00-\x20]*)?)(?:\?[^#\x00-\x20]*)?(?:#[^\x00-\x20]*)?$"
+)
 
 
-def is_date_only_anchor(anchor: str) -> bool:
-    if not isinstance(anchor, str):
-        return False
-    a = anchor.strip()
-    if not a:
-        return False
-    return any(re.match(p, a) for p in _DATE_ONLY_PATTERNS)
-
-
-def is_article_title_like_anchor(anchor: str) -> bool:
-    """
-    Exclude anchors that look like editorial headlines/listicles, e.g.:
-    - "13 beste WordPress Hosting Anbieter ..."
-    - "10 Tipps für ..."
-    - "7 Gründe warum ..."
-    """
-    if not isinstance(anchor, str):
-        return False
-
-    a = anchor.strip()
-    if not a:
-        return False
-
-    a_lc = a.lower()
-
-    if re.match(
-        r"^\s*\d{1,3}\s+(best|beste|top|tipps|tips|gründe|reasons|maßnahmen|measures|steps|schritte)\b",
-        a_lc,
-    ):
-        return True
-
-    if re.search(r"\b(vergleich|test|guide|anleitung|tutorial|checkliste|trends|liste|ranking)\b", a_lc):
-        if len(a) >= 35:
-            return True
-
-    if len(a) >= 90:
-        return True
-
-    return False
+def norm(s: Any) -> str:
+    return _WHITESPACE_RE.sub(" ", str(s or "").strip().lower())
 
 
-def norm(s: Any) -> str:
-    return re.sub(r"\s+", " ", str(s or "").strip().lower())
+def _url_path(url: str) -> str:
+    m = _URL_RE.match(url)
+    return m["path"] if m else urlparse(url).path
 
 
 def is_blog_url(url: str) -> bool:
     if not isinstance(url, str) or not url:
         return False
-    path = urlparse(url).path.lower()
+    path = _url_path(url).lower()
     return (
         path == "/blog"
         or path.startswith("/blog/")
@@ -213,13 +233,14 @@ def is_blog_url(url: str) -> bool:
 def source_is_en(url: str) -> bool:
     if not isinstance(url, str) or not url:
         return False
-    path = urlparse(url).path.lower()
+    path = _url_path(url).lower()
     return path.startswith("/en/") or path == "/en"
 
 
-def align_destination_language(target_url: str, source_url: str) -> str:
+def _align_to_language(target_url: str, s_is_en: bool) -> str:
     """
-    Ensure suggested destination matches the language bucket of the SOURCE.
+    Ensure suggested destination matches the language bucket of the SOURCE
+    (s_is_en = source_is_en(source_url)).
 
     Workist setup assumed:
     - English pages live under /en/...
@@ -228,10 +249,10 @@ def align_destination_language(target_url: str, source_url: str) -> str:
     if not isinstance(target_url, str) or not target_url:
         return target_url
 
-    t = urlparse(target_url)
-    s_is_en = source_is_en(source_url)
+    m = _URL_RE.match(target_url)
+    t = None if m else urlparse(target_url)
 
-    path = t.path or ""
+    path = (m["path"] if m else t.path) or ""
     if s_is_en:
         if not path.lower().startswith("/en/") and path.lower() != "/en":
             path = "/en" + (path if path.startswith("/") else "/" + path)
@@ -243,6 +264,9 @@ def align_destination_language(target_url: str, source_url: str) -> str:
         elif path.lower() == "/en":
             path = "/"
 
+    if m:
+        return f"{m['scheme']}://{m['host']}{path}".rstrip("/")
+
     rebuilt = t._replace(path=path, query="", fragment="")
     return rebuilt.geturl().rstrip("/")
 
@@ -250,13 +274,39 @@ def align_destination_language(target_url: str, source_url: str) -> str:
 def normalize_url_no_query(url: str) -> str:
     if not isinstance(url, str):
         return ""
+    m = _URL_RE.match(url)
+    if m:
+        return f"{m['scheme']}://{m['host']}{m['path']}".rstrip("/")
     p = urlparse(url)
     return p._replace(query="", fragment="").geturl().rstrip("/")
 
 
+def _map_unique(values: pd.Series, func) -> pd.Series:
+    """Applies func once per distinct value and broadcasts the results."""
+    uniques = values.unique()
+    return values.map(dict(zip(uniques, map(func, uniques))))
+
+
+def _re_mask(values: pd.Series, pattern: re.Pattern, method: str = "search") -> np.ndarray:
+    """
+    Evaluates a compiled pattern with Python re for every value.
+    (Series.str on Arrow-backed strings would hand it to RE2, whose
+    whitespace, digit and word-boundary classes are ASCII-only.)
+    Meant for small inputs such as the distinct anchors.
+    """
+    test = getattr(pattern, method)
+    return np.fromiter((test(v) is not None for v in values), dtype=bool, count=len(values))
+
+
+def _map_categories(values: pd.Series, func) -> np.ndarray:
+    """Applies func once per category of a categorical Series, broadcast via the codes."""
+    results = np.array([func(c) for c in values.cat.categories], dtype=object)
+    return results[values.cat.codes.to_numpy()]
+
+
 def clean_anchor_for_matching(anchor: str) -> str:
     a = norm(anchor)
-    a = re.sub(r"^(zum|zur|zu|to|for|über|about)\s+", "", a)
+    a = _LEADING_PREPOSITION_RE.sub("", a)
     return a
 
 
@@ -275,8 +325,8 @@ def is_strong_match(anchor: str, keyword: str) -> bool:
     if k in a and len(a.split()) <= 10:
         return True
 
-    anchor_tokens = set(re.findall(r"[a-z0-9]+", a))
-    keyword_tokens = set(re.findall(r"[a-z0-9]+", k))
+    anchor_tokens = set(_WORD_TOKEN_RE.findall(a))
+    keyword_tokens = set(_WORD_TOKEN_RE.findall(k))
 
     if keyword_tokens and len(keyword_tokens.intersection(anchor_tokens)) >= max(2, len(keyword_tokens) - 1):
         return True
@@ -288,71 +338,135 @@ def is_strong_match(anchor: str, keyword: str) -> bool:
 # Tab 3: Anchor Text Optimization
 # -------------------------------------------------------------------
 
-def build_anchor_optimization_report(
-    raw_links_list: List[Dict],
-    audited_df: pd.DataFrame,
-) -> pd.DataFrame:
-    """Commercial anchor -> commercial destination (ONLY when currently linking to a blog URL)."""
-    links_df = pd.DataFrame(raw_links_list)
-    if links_df.empty:
-        return pd.DataFrame()
+LINK_COLUMNS = ["source", "dest", "anchor"]
 
-    for col in ("source", "dest", "anchor"):
-        if col not in links_df.columns:
-            return pd.DataFrame()
+LinksInput = Union[List[Dict], Dict[str, List], pd.DataFrame, "pa.Table"]
 
-    links_df["source"] = links_df["source"].fillna("").astype(str)
-    links_df["dest"] = links_df["dest"].fillna("").astype(str)
-    links_df["anchor"] = links_df["anchor"].fillna("").astype(str)
 
-    rows: List[Dict[str, Any]] = []
+def _prepare_links(raw_links_list: LinksInput) -> pd.DataFrame:
+    """
+    Canonical links frame for the Phase 5 reports: source / dest / anchor
+    as stripped, categorical strings (missing -> ""). Empty frame if links are missing.
 
-    for _, r in links_df.iterrows():
-        src = r["source"].strip()
-        dst = r["dest"].strip()
-        anchor = r["anchor"].strip()
+    Accepts a list of link dicts, a dict of columns, a DataFrame or a
+    pyarrow Table.
+    """
+    if isinstance(raw_links_list, pd.DataFrame):
+        links_df = raw_links_list
+    elif pa is not None and isinstance(raw_links_list, pa.Table):
+        links_df = raw_links_list.to_pandas(types_mapper=pd.ArrowDtype)
+    elif isinstance(raw_links_list, dict):
+        links_df = pd.DataFrame(raw_links_list)
+    else:
+        # Fixed columns: no per-record key inference (a missing key -> "")
+        links_df = pd.DataFrame.from_records(raw_links_list, columns=LINK_COLUMNS)
 
-        if not anchor:
-            continue
+    if links_df.empty:
+        return pd.DataFrame()
 
-        if is_date_only_anchor(anchor):
-            continue
+    # columnar input (frame / dict / table) may lack a column entirely
+    if not set(LINK_COLUMNS).issubset(links_df.columns):
+        return pd.DataFrame()
 
-        if is_article_title_like_anchor(anchor):
-            continue
+    # Dictionary-encoded: link tables repeat the same pages and anchors,
+    # so per-value work downstream runs on the categories only
+    return pd.DataFrame({
+        col: links_df[col].fillna("").astype(str).str.strip().astype("category")
+        for col in LINK_COLUMNS
+    })
 
-        if not is_blog_url(dst):
-            continue
 
-        anchor_lc = norm(anchor)
+def build_anchor_optimization_report(
+    raw_links_list: LinksInput,
+    audited_df: pd.DataFrame,
+) -> pd.DataFrame:
+    """Commercial anchor -> commercial destination (ONLY when currently linking to a blog URL)."""
+    return _build_anchor_report(_prepare_links(raw_links_list))
 
-        matched_rule = None
-        for rule in COMMERCIAL_ANCHOR_RULES:
-            if re.search(rule["pattern"], anchor_lc, flags=re.IGNORECASE):
-                matched_rule = rule
-                break
 
-        if matched_rule is None:
-            continue
+def _build_anchor_report(links_df: pd.DataFrame) -> pd.DataFrame:
+    """build_anchor_optimization_report on a frame already built by _prepare_links()."""
+    if links_df.empty:
+        return pd.DataFrame()
 
-        suggested = align_destination_language(matched_rule["target_url"], src)
+    src = links_df["source"]
+    dst = links_df["dest"]
+    anchor = links_df["anchor"]
+
+    # Anchor filters and rule matching run once per distinct anchor
+    # (a category), then broadcast to the rows through the codes
+    anchors = pd.Series(anchor.cat.categories)
+    anchor_len = anchors.str.len()
+    anchor_lower = anchors.str.lower()
+
+    # Skip anchors that are purely dates, or look like editorial
+    # headlines/listicles ("13 beste ...", "10 Tipps für ...", long titles)
+    is_date_only = _re_mask(anchors, _DATE_ONLY_RE, "match")
+    is_title_like = (
+        _re_mask(anchor_lower, _LISTICLE_RE, "match")
+        | (_re_mask(anchor_lower, _HEADLINE_WORD_RE) & (anchor_len >= 35))
+        | (anchor_len >= 90)
+    )
+    usable = anchors.ne("") & ~is_date_only & ~is_title_like
+
+    # lower-case, collapse whitespace (norm() itself, in Python)
+    anchor_lc = anchors[usable].map(norm)
+
+    # Single union scan drops anchors no rule can match
+    anchor_lc = anchor_lc[_re_mask(anchor_lc, _ANY_RULE_RE)]
+
+    # One scan per rule (not per anchor) -> N x R match matrix;
+    # argmax picks the first matching rule, i.e. rule priority order
+    match_matrix = np.column_stack(
+        [_re_mask(anchor_lc, pattern) for pattern in _COMPILED_RULE_PATTERNS]
+    ).reshape(len(anchor_lc), len(_COMPILED_RULE_PATTERNS))
+    anchor_rule_idx = np.full(len(anchors), -1)
+    anchor_rule_idx[anchor_lc.index] = np.where(
+        match_matrix.any(axis=1), match_matrix.argmax(axis=1), -1
+    )
 
-        if normalize_url_no_query(dst) == normalize_url_no_query(suggested):
-            continue
+    row_rule_idx = anchor_rule_idx[anchor.cat.codes.to_numpy()]
+    keep = (row_rule_idx >= 0) & _map_categories(dst, is_blog_url).astype(bool)
+
+    matched = np.flatnonzero(keep)
+    matched_rule_idx = row_rule_idx[matched]
+
+    # Suggested destination depends only on (rule target, source language):
+    # resolve each distinct combination once, then merge back onto the rows
+    combos = pd.DataFrame({
+        "target_url": [COMMERCIAL_ANCHOR_RULES[r]["target_url"] for r in matched_rule_idx],
+        "s_is_en": _map_categories(src, source_is_en)[matched].astype(bool),
+    })
+    unique_combos = combos.drop_duplicates()
+    unique_combos = unique_combos.assign(suggested=[
+        _align_to_language(t, en)
+        for t, en in zip(unique_combos["target_url"], unique_combos["s_is_en"])
+    ])
+    suggested = pd.Series(
+        combos.merge(unique_combos, how="left", on=["target_url", "s_is_en"])["suggested"].to_numpy()
+    )
 
-        rows.append({
-            "page_to_edit": src,
-            "destination_page": dst,
-            "current_anchor": anchor,
-            "suggested_anchor": anchor,
-            "suggested_destination": suggested,
-            "rule_triggered": f"commercial_mapping: {matched_rule['kw']}",
-        })
+    already_there = (
+        _map_categories(dst, normalize_url_no_query)[matched]
+        == _map_unique(suggested, normalize_url_no_query).to_numpy()
+    )
 
-    if not rows:
+    # Single DataFrame construction from the column-wide masks (no per-row dicts)
+    emit = ~already_there
+    if not emit.any():
         return pd.DataFrame()
 
-    out = pd.DataFrame(rows)
+    rows_pos = matched[emit]
+    matched_kw = np.array([rule["kw"] for rule in COMMERCIAL_ANCHOR_RULES], dtype=object)
+
+    out = pd.DataFrame({
+        "page_to_edit": src.iloc[rows_pos].to_numpy(dtype=object),
+        "destination_page": dst.iloc[rows_pos].to_numpy(dtype=object),
+        "current_anchor": anchor.iloc[rows_pos].to_numpy(dtype=object),
+        "suggested_anchor": anchor.iloc[rows_pos].to_numpy(dtype=object),
+        "suggested_destination": suggested[emit].to_numpy(),
+        "rule_triggered": "commercial_mapping: " + matched_kw[matched_rule_idx[emit]],
+    })
 
     out = out.drop_duplicates(
         subset=["page_to_edit", "destination_page", "current_anchor", "suggested_destination"]
@@ -365,6 +479,16 @@ def build_anchor_optimization_report(
 # Tab 1: Page Summary Report
 # -------------------------------------------------------------------
 
+# Ordered tiers: sorting compares the int8 category codes, not strings
+PRIORITY_TIER_DTYPE = pd.CategoricalDtype(["A", "B", "C"], ordered=True)
+
+# gap_status -> "before" text (built once, mapped via index alignment)
+BEFORE_MAP = pd.Series({
+    "Medium: Poor Anchors": "Uses generic or non-descriptive anchor text",
+    "High: Under-Linked": "Receives insufficient internal links",
+})
+
+
 def build_page_summary_report(
     audited_df: pd.DataFrame,
     anchor_optimization_df: Optional[pd.DataFrame] = None,
@@ -374,36 +498,8 @@ def build_page_summary_report(
     Page summary with meaningful before / after.
     Only Tier A & B.
     """
-    report = audited_df[
-        audited_df["priority_tier"].isin(["A", "B"])
-    ].copy()
-
-    report["before"] = report["gap_status"].map({
-        "Medium: Poor Anchors": "Uses generic or non-descriptive anchor text",
-        "High: Under-Linked": "Receives insufficient internal links",
-    }).fillna("No major internal linking issues detected")
-
-    report["after"] = "No change required"
-
-    if opportunities_df is not None and not opportunities_df.empty:
-        affected_targets = set(opportunities_df["target_url"])
-        report.loc[
-            report["url"].isin(affected_targets),
-            "after"
-        ] = (
-            "Adding new internal links from relevant blog content will strengthen internal discoverability and support priority pages"
-        )
-
-    if anchor_optimization_df is not None and not anchor_optimization_df.empty:
-        affected_pages = set(anchor_optimization_df["page_to_edit"])
-        report.loc[
-            report["url"].isin(affected_pages),
-            "after"
-        ] = (
-            "Updating commercial anchors that currently link to blog pages will improve navigation from informational content to commercial pages"
-        )
-
-    return report[
+    report = audited_df.loc[
+        audited_df["priority_tier"].isin(["A", "B"]),
         [
             "url",
             "priority_tier",
@@ -411,12 +507,49 @@ def build_page_summary_report(
             "gap_status",
             "receiving_links",
             "link_equity_score",
-            "before",
-            "after",
-        ]
-    ].sort_values(
+        ],
+    ]
+
+    before = report["gap_status"].map(BEFORE_MAP).fillna(
+        "No major internal linking issues detected"
+    )
+
+    opp_msg = (
+        "Adding new internal links from relevant blog content will strengthen internal discoverability and support priority pages"
+    )
+    anchor_msg = (
+        "Updating commercial anchors that currently link to blog pages will improve navigation from informational content to commercial pages"
+    )
+
+    # One vectorized tagging pass; anchor work takes precedence over new links
+    tags = pd.DataFrame({"url": report["url"]})
+    tags["opp"] = False
+    tags["anchor"] = False
+
+    if opportunities_df is not None and not opportunities_df.empty:
+        tags["opp"] = tags["url"].isin(opportunities_df["target_url"].values)
+
+    if anchor_optimization_df is not None and not anchor_optimization_df.empty:
+        tags["anchor"] = tags["url"].isin(anchor_optimization_df["page_to_edit"].values)
+
+    after = np.select(
+        [tags["anchor"].to_numpy(), tags["opp"].to_numpy()],
+        [anchor_msg, opp_msg],
+        default="No change required",
+    )
+
+    # Low-cardinality text columns: store as categories (smaller, faster to sort/write)
+    report = report.assign(
+        priority_tier=report["priority_tier"].astype(PRIORITY_TIER_DTYPE),
+        gap_status=report["gap_status"].astype("category"),
+        before=before.astype("category"),
+        after=pd.Categorical(after),
+    )
+
+    return report.sort_values(
         by=["priority_tier", "priority_score"],
         ascending=[True, False],
+        kind="stable",
     )
 
 
@@ -432,17 +565,19 @@ def build_actionable_opportunities(
     if opportunities is None or opportunities.empty:
         return pd.DataFrame()
 
-    opp_df = opportunities.copy()
-
     priority_map = (
         audited_df[["url", "priority_tier"]]
         .set_index("url")["priority_tier"]
         .to_dict()
     )
 
-    opp_df["target_priority"] = opp_df["target_url"].map(priority_map)
+    opp_df = opportunities.loc[
+        :, ["target_url", "source_url", "suggested_anchor", "source_non_branded_traffic"]
+    ]
 
-    opp_df = opp_df[
+    opp_df = opp_df.assign(
+        target_priority=opp_df["target_url"].map(priority_map).astype(PRIORITY_TIER_DTYPE)
+    )[
         [
             "target_url",
             "target_priority",
@@ -455,9 +590,84 @@ def build_actionable_opportunities(
     return opp_df.sort_values(
         by=["target_priority", "source_non_branded_traffic"],
         ascending=[True, False],
+        kind="stable",
     )
 
 
+# -------------------------------------------------------------------
+# Excel output
+# -------------------------------------------------------------------
+
+def _excel_rows(df: pd.DataFrame):
+    """Header + data rows as plain Python values (missing -> empty cell)."""
+    yield [str(c) for c in df.columns]
+    values = df.astype(object).where(df.notna(), None)
+    yield from values.itertuples(index=False, name=None)
+
+
+def _write_excel_write_only(sheets: Dict[str, pd.DataFrame], output_path: Path) -> None:
+    """
+    openpyxl in write_only mode: rows are streamed to the sheet XML
+    instead of building a Cell object per value.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for sheet_name, df in sheets.items():
+        ws = wb.create_sheet(title=sheet_name)
+        for row in _excel_rows(df):
+            ws.append(row)
+    wb.save(output_path)
+
+
+def _write_parquet(sheets: Dict[str, pd.DataFrame], output_path: Path) -> None:
+    """One zstd-compressed Parquet file per sheet: <stem>_<name>.parquet"""
+    for sheet_name, df in sheets.items():
+        name = PARQUET_SHEET_NAMES[sheet_name]
+        df.to_parquet(
+            output_path.with_name(f"{output_path.stem}_{name}.parquet"),
+            engine="pyarrow",
+            compression="zstd",
+            index=False,
+        )
+
+
+def _write_excel_streaming(sheets: Dict[str, pd.DataFrame], output_path: Path) -> None:
+    """
+    xlsxwriter in constant_memory mode: rows are written in order with
+    write_row and flushed to the sheet XML as they go, instead of going
+    through to_excel's per-cell formatting layer. Cells are plain values
+    (see XLSXWRITER_OPTIONS); a sheet past Excel's size limit raises, as
+    to_excel does, instead of losing rows.
+    """
+    import xlsxwriter
+
+    for df in sheets.values():
+        # +1 for the header row
+        if len(df) + 1 > EXCEL_MAX_ROWS or len(df.columns) > EXCEL_MAX_COLS:
+            raise ValueError(
+                f"This sheet is too large! Your sheet size is: {len(df) + 1}, {len(df.columns)} "
+                f"Max sheet size is: {EXCEL_MAX_ROWS}, {EXCEL_MAX_COLS}"
+            )
+
+    wb = xlsxwriter.Workbook(
+        str(output_path), {"constant_memory": True, **XLSXWRITER_OPTIONS}
+    )
+    # same look as the pandas to_excel header
+    header_format = wb.add_format(
+        {"bold": True, "border": 1, "align": "center", "valign": "top"}
+    )
+
+    for sheet_name, df in sheets.items():
+        ws = wb.add_worksheet(sheet_name)
+        rows = _excel_rows(df)
+        ws.write_row(0, 0, next(rows), header_format)
+        for row_idx, row in enumerate(rows, start=1):
+            ws.write_row(row_idx, 0, row)
+
+    wb.close()
+
+
 # -------------------------------------------------------------------
 # Phase 5 Entry Point
 # -------------------------------------------------------------------
@@ -465,17 +675,17 @@ def build_actionable_opportunities(
 def export_internal_linking_report(
     audited_df: pd.DataFrame,
     opportunities: pd.DataFrame,
-    raw_links_list: List[Dict],
+    raw_links_list: LinksInput,
     output_path: Union[str, Path],
 ) -> None:
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    anchor_optimization_df = build_anchor_optimization_report(
-        raw_links_list,
-        audited_df,
-    )
+    # Links are normalized once and shared by every report that needs them
+    links_df = _prepare_links(raw_links_list)
+
+    anchor_optimization_df = _build_anchor_report(links_df)
 
     page_summary_df = build_page_summary_report(
         audited_df=audited_df,
@@ -488,21 +698,17 @@ def export_internal_linking_report(
         audited_df,
     )
 
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        page_summary_df.to_excel(
-            writer,
-            sheet_name="Page_Summary_Report",
-            index=False,
-        )
+    sheets = {
+        "Page_Summary_Report": page_summary_df,
+        "Actionable_Opportunities": actionable_df,
+        "Anchor_Text_Optimization": anchor_optimization_df,
+    }
 
-        actionable_df.to_excel(
-            writer,
-            sheet_name="Actionable_Opportunities",
-            index=False,
-        )
+    if output_path.suffix == ".parquet":
+        _write_parquet(sheets, output_path)
+        return
 
-        anchor_optimization_df.to_excel(
-            writer,
-            sheet_name="Anchor_Text_Optimization",
-            index=False,
-        )
\ No newline at end of file
+    if EXCEL_ENGINE == "openpyxl":
+        _write_excel_write_only(sheets, output_path)
+    else:
+        _write_excel_streaming(sheets, output_path)
\ No newline at end of file